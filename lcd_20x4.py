@@ -1,71 +1,150 @@
 import machine
+import micropython
 import time
-from re import match
+from micropython import const
 
 # LCD Commands
-LCD_CLEARDISPLAY = 0x01
-LCD_RETURNHOME = 0x02
-LCD_ENTRYMODESET = 0x04
-LCD_DISPLAYCONTROL = 0x08
-LCD_CURSORSHIFT = 0x10
-LCD_FUNCTIONSET = 0x20
-LCD_SETCGRAMADDR = 0x40
-LCD_SETDDRAMADDR = 0x80
+LCD_CLEARDISPLAY = const(0x01)
+LCD_RETURNHOME = const(0x02)
+LCD_ENTRYMODESET = const(0x04)
+LCD_DISPLAYCONTROL = const(0x08)
+LCD_CURSORSHIFT = const(0x10)
+LCD_FUNCTIONSET = const(0x20)
+LCD_SETCGRAMADDR = const(0x40)
+LCD_SETDDRAMADDR = const(0x80)
 
 # Entry mode flags
-LCD_ENTRYRIGHT = 0x00
-LCD_ENTRYLEFT = 0x02
-LCD_ENTRYSHIFTINCREMENT = 0x01
-LCD_ENTRYSHIFTDECREMENT = 0x00
+LCD_ENTRYRIGHT = const(0x00)
+LCD_ENTRYLEFT = const(0x02)
+LCD_ENTRYSHIFTINCREMENT = const(0x01)
+LCD_ENTRYSHIFTDECREMENT = const(0x00)
 
 # Display control flags
-LCD_DISPLAYON = 0x04
-LCD_DISPLAYOFF = 0x00
-LCD_CURSORON = 0x02
-LCD_CURSOROFF = 0x00
-LCD_BLINKON = 0x01
-LCD_BLINKOFF = 0x00
+LCD_DISPLAYON = const(0x04)
+LCD_DISPLAYOFF = const(0x00)
+LCD_CURSORON = const(0x02)
+LCD_CURSOROFF = const(0x00)
+LCD_BLINKON = const(0x01)
+LCD_BLINKOFF = const(0x00)
 
 # Cursor/display shift flags
-LCD_DISPLAYMOVE = 0x08
-LCD_CURSORMOVE = 0x00
-LCD_MOVERIGHT = 0x04
-LCD_MOVELEFT = 0x00
+LCD_DISPLAYMOVE = const(0x08)
+LCD_CURSORMOVE = const(0x00)
+LCD_MOVERIGHT = const(0x04)
+LCD_MOVELEFT = const(0x00)
 
 # Function set flags
-LCD_8BITMODE = 0x10
-LCD_4BITMODE = 0x00
-LCD_2LINE = 0x08
-LCD_1LINE = 0x00
-LCD_5x10DOTS = 0x04
-LCD_5x8DOTS = 0x00
+LCD_8BITMODE = const(0x10)
+LCD_4BITMODE = const(0x00)
+LCD_2LINE = const(0x08)
+LCD_1LINE = const(0x00)
+LCD_5x10DOTS = const(0x04)
+LCD_5x8DOTS = const(0x00)
 
 # Backlight control
-LCD_BACKLIGHT = 0x08
-LCD_NOBACKLIGHT = 0x00
+LCD_BACKLIGHT = const(0x08)
+LCD_NOBACKLIGHT = const(0x00)
 
 # PCF8574 pin mapping
-En = 0b00000100  # Enable bit
-Rw = 0b00000010  # Read/Write bit
-Rs = 0b00000001  # Register select bit
+En = const(0b00000100)  # Enable bit
+Rw = const(0b00000010)  # Read/Write bit
+Rs = const(0b00000001)  # Register select bit
+
+# DDRAM address of the first column of each row (20x4 layout)
+_ROW_OFFSETS = b'\x00\x40\x14\x54'
+
+# Blank custom character rows used to pad short load_char() input
+_BLANK_ROWS = bytes(8)
+
+# Valid digits for {0xFF} escapes in print_ext()
+_HEX_DIGITS = '0123456789abcdefABCDEF'
+
+_ticks_us = time.ticks_us
+_ticks_diff = time.ticks_diff
+
+@micropython.viper
+def _spin_us(n: int):
+    """Busy-wait n microseconds; cheaper than sleep_us() for short waits"""
+    t0 = _ticks_us()
+    while int(_ticks_diff(_ticks_us(), t0)) < n:
+        pass
+
+@micropython.viper
+def _fill_char_buf(buf: ptr8, idx: int, ch: int, mode: int, bl: int) -> int:
+    """Encode one byte as 6 expander writes at buf[idx], return next index"""
+    hi = mode | (ch & 0xF0) | bl
+    lo = mode | ((ch << 4) & 0xF0) | bl
+    buf[idx] = hi
+    buf[idx + 1] = hi | En
+    buf[idx + 2] = hi
+    buf[idx + 3] = lo
+    buf[idx + 4] = lo | En
+    buf[idx + 5] = lo
+    return idx + 6
+
+@micropython.viper
+def _enc(dst: ptr8, off: int, src: ptr8, n: int, bl: int, rs: int) -> int:
+    """Encode n bytes of src as expander writes at dst[off], return next index"""
+    j = off
+    for i in range(n):
+        ch = src[i]
+        hi = rs | (ch & 0xF0) | bl
+        lo = rs | ((ch << 4) & 0xF0) | bl
+        dst[j] = hi
+        dst[j + 1] = hi | En
+        dst[j + 2] = hi
+        dst[j + 3] = lo
+        dst[j + 4] = lo | En
+        dst[j + 5] = lo
+        j += 6
+    return j
 
 class LCD:
-    def __init__(self, i2c, addr=0x27, cols=20, rows=4, charsize=LCD_5x8DOTS):
+    def __init__(self, i2c, addr=0x27, cols=20, rows=4, charsize=LCD_5x8DOTS,
+                 scl=None, sda=None, freq=400000):
         """Initialize LCD with I2C connection
         
         Args:
-            i2c: MicroPython I2C object
+            i2c: MicroPython I2C object, or an I2C bus id to create one
             addr: I2C address (default 0x27)
             cols: Number of columns (default 20)
             rows: Number of rows (default 4)
             charsize: Character size (default 5x8)
+            scl: SCL pin when creating the bus (default: port default)
+            sda: SDA pin when creating the bus (default: port default)
+            freq: I2C clock in Hz when creating the bus (default 400000,
+                higher clocks break the HD44780 execution time)
         """
+        if isinstance(i2c, int):
+            pins = {}
+            if scl is not None:
+                pins['scl'] = machine.Pin(scl)
+            if sda is not None:
+                pins['sda'] = machine.Pin(sda)
+            i2c = machine.I2C(i2c, freq=freq, **pins)
         self._i2c = i2c
         self._addr = addr
         self._cols = cols
         self._rows = rows
         self._charsize = charsize
         self._backlightval = LCD_BACKLIGHT
+        # Cache bound methods used on every write
+        self._writeto = i2c.writeto
+        self._sleep_ms = time.sleep_ms
+        # Scratch buffers, reused to avoid allocating on every write
+        self._one = bytearray(1)  # Single expander byte
+        self._bl_on = bytes([LCD_BACKLIGHT])  # Backlight on, all lines low
+        self._bl_off = bytes([LCD_NOBACKLIGHT])  # Backlight off, all lines low
+        self._sendbuf = bytearray(6)  # Burst buffer for send()
+        self._charbuf = bytearray(6 * 8)  # One custom character for load_char()
+        self._linebuf = bytearray(6 * (cols + 1))  # Cursor + one full line
+        self._linemv = memoryview(self._linebuf)  # For partial-line writes
+        # All lines, plus room for a trailing cursor move in clear_fast()
+        self._framebuf = bytearray(6 * ((cols + 1) * rows + 1))
+        self._frame = memoryview(self._framebuf)[:-6]  # All lines only
+        self._tables_on = self._build_nibble_tables(LCD_BACKLIGHT)
+        self._tables_off = self._build_nibble_tables(LCD_NOBACKLIGHT)
+        self._select_nibble_tables()
         
         # Set display function based on rows and character size
         if self._rows > 1:
@@ -78,20 +157,28 @@ class LCD:
         # Initialize LCD according to HD44780 datasheet
         time.sleep_ms(50)  # Wait for power-up
         
-        # Put LCD into 4-bit mode (this is according to HD44780 datasheet)
-        self.write4bits(0x03 << 4)
-        time.sleep_ms(5)
-        self.write4bits(0x03 << 4)
-        time.sleep_ms(5)
-        self.write4bits(0x03 << 4)
-        time.sleep_us(150)
+        # Put LCD into 4-bit mode (this is according to HD44780 datasheet).
+        # Each nibble goes out with its enable pulse in one I2C write; the
+        # datasheet waits after the first two resets are kept.
+        bl = self._backlightval
+        reset = bytes([0x30 | bl, 0x30 | bl | En, 0x30 | bl])
+        self._writeto(self._addr, reset)
+        time.sleep_ms(5)  # >4.1ms
+        self._writeto(self._addr, reset)
+        _spin_us(150)  # >100us
         
-        # Finally, set to 4-bit interface
-        self.write4bits(0x02 << 4)
+        # Third reset and switch to 4-bit interface in one burst
+        four_bit = bytes([0x20 | bl, 0x20 | bl | En, 0x20 | bl])
+        self._writeto(self._addr, reset + four_bit)
+        _spin_us(40)  # Command execution time (>37us)
         
         # Set number of lines, font size, etc.
         self.command(LCD_FUNCTIONSET | self._displayfunction)
         
+        # Last values sent, used to skip redundant commands
+        self._last_displaycontrol = None
+        self._last_displaymode = None
+        
         # Turn display on with no cursor or blinking
         self._displaycontrol = LCD_DISPLAYON | LCD_CURSOROFF | LCD_BLINKOFF
         self.display()
@@ -101,7 +188,7 @@ class LCD:
         
         # Initialize text direction (left to right)
         self._displaymode = LCD_ENTRYLEFT | LCD_ENTRYSHIFTDECREMENT
-        self.command(LCD_ENTRYMODESET | self._displaymode)
+        self._update_entry_mode()
         
         # Return home
         self.home()
@@ -113,20 +200,59 @@ class LCD:
 
     def expander_write(self, cmd):
         """Write byte to I2C expander"""
-        self._i2c.writeto(self._addr, bytes([cmd | self._backlightval]))
-        time.sleep_us(100)  # Short delay
+        self._one[0] = cmd | self._backlightval
+        self._writeto(self._addr, self._one)
 
     def pulse_enable(self, data):
         """Pulse the enable bit to latch command"""
+        # No delays needed: each I2C byte takes longer than the HD44780
+        # minimum enable pulse width
         self.expander_write(data | En)
-        time.sleep_us(500)  # Enable pulse width
         self.expander_write(data & ~En)
-        time.sleep_us(100)  # Hold time
 
+    def _build_nibble_tables(self, bl):
+        """Precompute expander bytes for every nibble value
+        
+        Entries are already ORed with the backlight bit bl (and Rs for data).
+        Also returns the 6-byte encoding of a space used to pad lines.
+        """
+        space = bytearray(6)
+        _fill_char_buf(space, 0, 0x20, Rs, bl)
+        return (bytes([(v << 4) | bl for v in range(16)]),
+                bytes([(v << 4) | bl | Rs for v in range(16)]),
+                bytes(space))
+
+    def _select_nibble_tables(self):
+        """Switch to the precomputed tables for the current backlight state
+        
+        These tables are the only encoded data kept across writes; scratch
+        buffers are re-encoded on every use and prepare_char() returns raw
+        rows, so nothing else carries a stale backlight bit.
+        """
+        if self._backlightval:
+            tables = self._tables_on
+        else:
+            tables = self._tables_off
+        self._cmd_nibs, self._data_nibs, self._space_enc = tables
+
+    @micropython.native
     def send(self, cmd, mode=0):
-        """Send command or data to LCD"""
-        self.write4bits(mode | (cmd & 0xF0))
-        self.write4bits(mode | ((cmd << 4) & 0xF0))
+        """Send command or data to LCD
+        
+        Both nibbles and their enable pulses go out in a single I2C write.
+        """
+        nibs = self._data_nibs if mode else self._cmd_nibs
+        hi = nibs[(cmd >> 4) & 0x0F]
+        lo = nibs[cmd & 0x0F]
+        buf = self._sendbuf
+        buf[0] = hi
+        buf[1] = hi | En
+        buf[2] = hi
+        buf[3] = lo
+        buf[4] = lo | En
+        buf[5] = lo
+        self._writeto(self._addr, buf)
+        _spin_us(40)  # Command execution time (>37us)
 
     def command(self, value):
         """Send command to LCD"""
@@ -140,53 +266,86 @@ class LCD:
     def clear(self):
         """Clear the display"""
         self.command(LCD_CLEARDISPLAY)
-        time.sleep_ms(2)  # Clear command takes longer
+        self._last_displaymode = None  # Clear resets the entry direction
+        self._sleep_ms(2)  # Clear command takes longer
+
+    def clear_fast(self):
+        """Blank the display by overwriting every line with spaces
+        
+        Sends one I2C transaction and avoids the 2ms clear command wait.
+        Unlike clear(), display shift is left untouched. Cursor ends at (0, 0).
+        """
+        buf = self._framebuf
+        off = 0
+        for row in range(self._rows):
+            off = self._encode_line(buf, off, "", row)
+        _fill_char_buf(buf, off, self._cursor_cmd(0, 0), 0, self._backlightval)
+        self._writeto(self._addr, buf)
+        _spin_us(40)  # Command execution time (>37us)
 
     def home(self):
         """Return cursor to home position"""
         self.command(LCD_RETURNHOME)
-        time.sleep_ms(2)  # Home command takes longer
+        self._sleep_ms(2)  # Home command takes longer
+
+    def _cursor_cmd(self, col, row):
+        """Build the DDRAM address command for a cursor position"""
+        row = min(row, self._rows - 1)
+        col = min(col, self._cols - 1)
+        return LCD_SETDDRAMADDR | (col + _ROW_OFFSETS[row])
 
     def set_cursor(self, col, row):
         """Set cursor position (0-indexed)"""
-        # Corrected row offsets for 20x4 displays
-        row_offsets = [0x00, 0x40, 0x14, 0x54]
-        if row >= self._rows:
-            row = self._rows - 1
-        if col >= self._cols:
-            col = self._cols - 1
-        self.command(LCD_SETDDRAMADDR | (col + row_offsets[row]))
+        self.command(self._cursor_cmd(col, row))
 
     # Display control
+    def configure(self, display=None, cursor=None, blink=None):
+        """Update display, cursor and blink state with a single command
+        
+        Args:
+            display: True/False to turn display on/off, None to keep
+            cursor: True/False to show/hide cursor, None to keep
+            blink: True/False to enable/disable blinking, None to keep
+        """
+        control = self._displaycontrol
+        for enabled, flag in ((display, LCD_DISPLAYON),
+                              (cursor, LCD_CURSORON),
+                              (blink, LCD_BLINKON)):
+            if enabled is None:
+                continue
+            if enabled:
+                control |= flag
+            else:
+                control &= ~flag
+        self._displaycontrol = control
+        if control == self._last_displaycontrol:
+            return
+        self.command(LCD_DISPLAYCONTROL | control)
+        self._last_displaycontrol = control
+
     def no_display(self):
         """Turn display off"""
-        self._displaycontrol &= ~LCD_DISPLAYON
-        self.command(LCD_DISPLAYCONTROL | self._displaycontrol)
+        self.configure(display=False)
 
     def display(self):
         """Turn display on"""
-        self._displaycontrol |= LCD_DISPLAYON
-        self.command(LCD_DISPLAYCONTROL | self._displaycontrol)
+        self.configure(display=True)
 
     def no_cursor(self):
         """Turn cursor off"""
-        self._displaycontrol &= ~LCD_CURSORON
-        self.command(LCD_DISPLAYCONTROL | self._displaycontrol)
+        self.configure(cursor=False)
 
     def cursor(self):
         """Turn cursor on"""
-        self._displaycontrol |= LCD_CURSORON
-        self.command(LCD_DISPLAYCONTROL | self._displaycontrol)
+        self.configure(cursor=True)
 
     def no_blink(self):
         """Turn blinking cursor off"""
-        self._displaycontrol &= ~LCD_BLINKON
-        self.command(LCD_DISPLAYCONTROL | self._displaycontrol)
+        self.configure(blink=False)
 
     def blink(self):
         """Turn blinking cursor on"""
-        self._displaycontrol |= LCD_BLINKON
-        self.command(LCD_DISPLAYCONTROL | self._displaycontrol)
+        self.configure(blink=True)
 
     # Scrolling functions
     def scroll_display_left(self):
@@ -198,25 +357,32 @@ class LCD:
         self.command(LCD_CURSORSHIFT | LCD_DISPLAYMOVE | LCD_MOVERIGHT)
 
     # Text direction
+    def _update_entry_mode(self):
+        """Send the entry mode command unless it is already in effect"""
+        if self._displaymode == self._last_displaymode:
+            return
+        self.command(LCD_ENTRYMODESET | self._displaymode)
+        self._last_displaymode = self._displaymode
+
     def left_to_right(self):
         """Set text direction left to right"""
         self._displaymode |= LCD_ENTRYLEFT
-        self.command(LCD_ENTRYMODESET | self._displaymode)
+        self._update_entry_mode()
 
     def right_to_left(self):
         """Set text direction right to left"""
         self._displaymode &= ~LCD_ENTRYLEFT
-        self.command(LCD_ENTRYMODESET | self._displaymode)
+        self._update_entry_mode()
 
     def autoscroll(self):
         """Enable autoscroll"""
         self._displaymode |= LCD_ENTRYSHIFTINCREMENT
-        self.command(LCD_ENTRYMODESET | self._displaymode)
+        self._update_entry_mode()
 
     def no_autoscroll(self):
         """Disable autoscroll"""
         self._displaymode &= ~LCD_ENTRYSHIFTINCREMENT
-        self.command(LCD_ENTRYMODESET | self._displaymode)
+        self._update_entry_mode()
 
     # Custom characters
     def create_char(self, location, charmap):
@@ -226,12 +392,23 @@ class LCD:
             location: Character location (0-7)
             charmap: List of 8 integers defining character pattern
         """
-        if not isinstance(charmap, list):
-            raise TypeError(f"charmap must be a list, got {type(charmap)}")
-        
         if location < 0 or location > 7:
             raise ValueError(f"location must be 0-7, got {location}")
         
+        self.load_char(location, self.prepare_char(charmap))
+
+    def prepare_char(self, charmap):
+        """Validate and pack a custom character for load_char()
+        
+        Args:
+            charmap: List of up to 8 integers defining character pattern
+        
+        Returns:
+            bytes holding the 8 validated rows
+        """
+        if not isinstance(charmap, list):
+            raise TypeError(f"charmap must be a list, got {type(charmap)}")
+        
         if len(charmap) > 8:
             raise ValueError(f"charmap too long: {len(charmap)}, max 8")
         
@@ -246,62 +423,151 @@ class LCD:
             if row < 0 or row > 0x1F:
                 raise ValueError(f"charmap[{i}] must be 0-31, got {row}")
         
-        # Write character to CGRAM
-        self.command(LCD_SETCGRAMADDR | (location << 3))
-        for row in charmap:
-            self.write(row)
+        return bytes(charmap)
+
+    def load_char(self, location, prepared):
+        """Write a character from prepare_char() to CGRAM without re-validating
+        
+        Args:
+            location: Character location (0-7)
+            prepared: Character rows returned by prepare_char()
+        """
+        # Encode at load time so the current backlight state is kept
+        buf = self._charbuf
+        bl = self._backlightval
+        # Never read past a short buffer, pad missing rows with blanks
+        n = min(len(prepared), 8)
+        off = _enc(buf, 0, prepared, n, bl, Rs)
+        _enc(buf, off, _BLANK_ROWS, 8 - n, bl, Rs)
+        self.command(LCD_SETCGRAMADDR | ((location & 0x07) << 3))
+        self._writeto(self._addr, buf)
+        _spin_us(40)  # Command execution time (>37us)
 
     # Backlight control
     def no_backlight(self):
         """Turn backlight off"""
         self._backlightval = LCD_NOBACKLIGHT
-        self.expander_write(0)
+        self._select_nibble_tables()
+        self._writeto(self._addr, self._bl_off)
 
     def backlight(self):
         """Turn backlight on"""
         self._backlightval = LCD_BACKLIGHT
-        self.expander_write(0)
+        self._select_nibble_tables()
+        self._writeto(self._addr, self._bl_on)
 
     # String printing
+    def _encode_text(self, buf, off, text, n):
+        """Encode the first n characters of text as data at buf[off], return next index"""
+        data = text.encode()
+        if len(data) == len(text):
+            # Plain ASCII, encode the raw bytes in one pass
+            return _enc(buf, off, data, n, self._backlightval, Rs)
+        fill = _fill_char_buf
+        bl = self._backlightval
+        for char in text[:n]:
+            off = fill(buf, off, ord(char), Rs, bl)
+        return off
+
+    def _scratch(self, size):
+        """Return a buffer of at least size bytes, the line buffer if it fits"""
+        if size <= len(self._linebuf):
+            return self._linebuf
+        return bytearray(size)
+
+    def _write_scratch(self, buf, size):
+        """Write the first size bytes of a buffer from _scratch()"""
+        if size == len(buf):
+            self._writeto(self._addr, buf)
+        elif buf is self._linebuf:
+            self._writeto(self._addr, self._linemv[:size])
+        else:
+            self._writeto(self._addr, memoryview(buf)[:size])
+        _spin_us(40)  # Command execution time (>37us)
+
     def print(self, string):
-        """Print string to LCD"""
-        for char in string:
-            self.write(ord(char))
+        """Print string to LCD in a single I2C transaction"""
+        if not string:
+            return
+        n = len(string)
+        buf = self._scratch(6 * n)
+        self._write_scratch(buf, self._encode_text(buf, 0, string, n))
 
     def print_ext(self, string):
         """Print extended string with hex character support
         
         Use {0xFF} syntax for special characters
         """
-        while string:
+        n = len(string)
+        if not n:
+            return
+        # Escapes only shrink the output, so 6 bytes per input char is enough
+        buf = self._scratch(6 * n)
+        fill = _fill_char_buf
+        bl = self._backlightval
+        off = 0
+        i = 0
+        while i < n:
+            char = string[i]
             # Look for hex pattern {0xFF}
-            hex_match = match(r'\{0[xX][0-9a-fA-F]{2}\}', string)
-            if hex_match:
-                # Convert hex to integer and write
-                hex_value = int(hex_match.group(0)[1:-1], 16)
-                self.write(hex_value)
-                string = string[6:]  # Skip the {0xFF} part
+            if (char == '{' and i + 5 < n and string[i + 5] == '}'
+                    and string[i + 1] == '0' and string[i + 2] in 'xX'
+                    and string[i + 3] in _HEX_DIGITS
+                    and string[i + 4] in _HEX_DIGITS):
+                off = fill(buf, off, int(string[i + 3:i + 5], 16), Rs, bl)
+                i += 6  # Skip the {0xFF} part
             else:
                 # Normal character
-                self.write(ord(string[0]))
-                string = string[1:]
+                off = fill(buf, off, ord(char), Rs, bl)
+                i += 1
+        self._write_scratch(buf, off)
 
     # Convenience methods
-    def print_line(self, text, line, center=False):
-        """Print text on specific line, optionally centered"""
-        self.set_cursor(0, line)
-        
+    def _encode_line(self, buf, off, text, line, center=False):
+        """Encode cursor move plus one padded line at buf[off], return next index"""
+        cols = self._cols
+        padding = 0
         if center:
             # Center the text
-            padding = (self._cols - len(text)) // 2
-            text = " " * padding + text
+            padding = max((cols - len(text)) // 2, 0)
         
-        # Pad or truncate to fit line - MicroPython compatible
-        text = text[:self._cols]  # Truncate if too long
-        text = text + " " * (self._cols - len(text))  # Pad with spaces
-        self.print(text)
+        # Encode straight into the buffer, padding with spaces
+        end = off + 6 * (cols + 1)
+        space = self._space_enc
+        off = _fill_char_buf(buf, off, self._cursor_cmd(0, line), 0,
+                             self._backlightval)
+        for _ in range(padding):
+            buf[off:off + 6] = space
+            off += 6
+        # Truncate if too long
+        off = self._encode_text(buf, off, text, min(len(text), cols - padding))
+        while off < end:
+            buf[off:off + 6] = space
+            off += 6
+        return off
+
+    def print_line(self, text, line, center=False):
+        """Print text on specific line, optionally centered
+        
+        The cursor move and the text are sent together in one I2C transaction.
+        """
+        self._encode_line(self._linebuf, 0, text, line, center)
+        self._writeto(self._addr, self._linebuf)
+        _spin_us(40)  # Command execution time (>37us)
+
+    def print_lines(self, lines, center=False):
+        """Print a full frame, one string per line, in one I2C transaction
+        
+        Missing lines are blanked and extra lines are ignored.
+        """
+        buf = self._framebuf
+        off = 0
+        for row in range(self._rows):
+            text = lines[row] if row < len(lines) else ""
+            off = self._encode_line(buf, off, text, row, center)
+        self._writeto(self._addr, self._frame)
+        _spin_us(40)  # Command execution time (>37us)
 
     def clear_line(self, line):
         """Clear specific line"""
-        self.set_cursor(0, line)
-        self.print(" " * self._cols)
+        self.print_line("", line)
@@ -6,7 +6,7 @@ print("MicroPython LCD Test Starting...")
 
 # Initialize I2C and LCD
 try:
-    i2c = machine.I2C(0, scl=machine.Pin(22), sda=machine.Pin(21))
+    i2c = machine.I2C(0, scl=machine.Pin(22), sda=machine.Pin(21), freq=400000)
     
     # Scan for devices first
     devices = i2c.scan()
@@ -138,6 +138,73 @@ def test_backlight():
     lcd.print_line("Backlight ON!", 1, center=True)
     time.sleep(2)
 
+def test_print_lines():
+    print("Test 7: Full frame with print_lines")
+    lcd.clear()
+    lcd.print_lines(["MicroPython LCD", "Frame Test", "Line 3", "Line 4"])
+    time.sleep(2)
+    lcd.print_lines(["Centered", "Frame"], center=True)
+    time.sleep(2)
+
+def test_clear_fast():
+    print("Test 8: Fast refresh with clear_fast")
+    for i in range(10):
+        lcd.clear_fast()
+        lcd.print("Refresh " + str(i))
+        lcd.set_cursor(0, 1)
+        lcd.print("Cursor back at 0,0")
+        time.sleep(0.2)
+    time.sleep(2)
+
+def test_configure():
+    print("Test 9: Display settings with configure")
+    lcd.clear()
+    lcd.print_line("Cursor + blink", 0)
+    lcd.set_cursor(0, 1)
+    lcd.configure(cursor=True, blink=True)
+    time.sleep(2)
+    
+    lcd.print_line("Display off/on", 0)
+    lcd.configure(display=False)
+    time.sleep(1)
+    lcd.configure(display=True)
+    time.sleep(1)
+    
+    lcd.configure(cursor=False, blink=False)
+    lcd.print_line("Cursor off", 0)
+    time.sleep(2)
+
+def test_custom_chars():
+    print("Test 10: Custom character animation")
+    frames = [
+        lcd.prepare_char([0b00000, 0b01010, 0b11111, 0b11111, 0b01110, 0b00100]),
+        lcd.prepare_char([0b00000, 0b00000, 0b01010, 0b01110, 0b00100]),
+    ]
+    lcd.clear()
+    lcd.print_line("Heartbeat:", 0)
+    lcd.set_cursor(11, 0)
+    lcd.write(0)
+    
+    for i in range(10):
+        lcd.load_char(0, frames[i % 2])
+        time.sleep(0.3)
+    
+    # Loading after a backlight change must not turn the backlight back on
+    lcd.no_backlight()
+    lcd.load_char(0, frames[0])
+    time.sleep(1)
+    lcd.backlight()
+    time.sleep(1)
+
+def test_print_ext_long():
+    print("Test 11: Long print_ext with escape")
+    lcd.clear()
+    lcd.print_line("Hello", 3)
+    lcd.set_cursor(0, 0)
+    # Longer than a line, so it does not use the shared line buffer
+    lcd.print_ext("Temp: 25{0xDF}C and rising quickly")
+    time.sleep(3)
+
 # Run all tests
 try:
     test_basic_display()
@@ -145,6 +212,11 @@ try:
     test_scrolling_text()
     test_counter()
     test_backlight()
+    test_print_lines()
+    test_clear_fast()
+    test_configure()
+    test_custom_chars()
+    test_print_ext_long()
     test_button_interactive()
     
     # Final message